@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
-from datetime import datetime
+from datetime import date, datetime
+import html
+import os
 import time
 import re
 from naver_blog_md import (
@@ -8,6 +12,12 @@ from naver_blog_md import (
     use_post,
     with_fetched_local_images  # Fetch images into local directory while rendering
 )
+from naver_blog_md.http.session import SESSION
+from naver_blog_md.http.throttle import use_throttle
+
+_SANITIZE_NONWORD = re.compile(r'[^\w\s가-힣-]')
+_SANITIZE_SPACES = re.compile(r'\s+')
+_SANITIZE_DASHES = re.compile(r'-+')
 
 
 def crawl(blog_id: str, posts_directory: Path, assets_directory: Path):
@@ -15,50 +25,90 @@ def crawl(blog_id: str, posts_directory: Path, assets_directory: Path):
     posts_directory.mkdir(parents=True, exist_ok=True)
     assets_directory.mkdir(parents=True, exist_ok=True)
 
-    (posts,) = use_blog(blog_id)
-
-    for post in posts():
-        try:
-            # 파일명 미리 생성하여 존재 여부 확인
-            metadata, as_markdown, _ = use_post(blog_id, post.log_no)
-            filename = to_filename(metadata())
-            markdown_file = posts_directory / f"{filename}.md"
-
-            # 이미 파일이 존재하면 건너뛰기
-            if markdown_file.exists():
-                print(f"[*] Skipping: {filename}.md (already exists)")
+    # 이미 저장된 포스트 목록을 한 번만 읽어 두고 루프에서는 집합으로 확인
+    existing_files = {
+        entry.name for entry in os.scandir(posts_directory) if entry.name.endswith('.md')
+    }
+
+    # 서버가 429/5xx로 응답할 때만 요청 간격을 늘림
+    wait, observe = use_throttle()
+
+    # 마크다운 저장은 별도 스레드에서 처리하여 다음 포스트 크롤링과 겹치도록 함
+    with ThreadPoolExecutor(max_workers=2) as writer, ExitStack() as stack:
+        SESSION.hooks["response"].append(observe)
+        stack.callback(SESSION.hooks["response"].remove, observe)
+
+        (posts,) = use_blog(blog_id)
+
+        for post in posts():
+            try:
+                # 목록 응답의 제목/작성일로 파일명을 만들어 포스트 요청 전에 존재 여부 확인
+                listed_filename = to_filename(
+                    {"title": html.unescape(post.title), "pubDate": post.add_date}
+                )
+                if f"{listed_filename}.md" in existing_files:
+                    print(f"[*] Skipping: {listed_filename}.md (already exists)")
+                    continue
+
+                wait()
+
+                # 목록 정보와 실제 메타데이터가 다를 수 있으므로 다시 확인
+                metadata, as_markdown, _ = use_post(blog_id, post.log_no)
+                filename = to_filename(metadata())
+                markdown_file = posts_directory / f"{filename}.md"
+
+                # 이미 파일이 존재하면 건너뛰기
+                if markdown_file.name in existing_files:
+                    print(f"[*] Skipping: {filename}.md (already exists)")
+                    continue
+
+                # 파일이 없으면 크롤링 진행
+                post_assets_directory = assets_directory / filename
+                post_assets_directory.mkdir(exist_ok=True)
+
+                render_context = with_fetched_local_images(
+                    num_workers=8,
+                    assets_directory=post_assets_directory,
+                    image_src_prefix=f"assets/{filename}/",
+                )
+
+                # 인코딩 오류는 아래 except에서 보고되도록 메인 스레드에서 처리
+                markdown = as_markdown(**render_context).encode('utf-8')
+                writer.submit(_save_markdown, markdown_file, markdown)
+                existing_files.add(markdown_file.name)
+
+            except ValueError as e:
+                if "Unknown component type" in str(e):
+                    print(f"[*]  Skipped post due to unsupported component: {e}")
+                    continue
+                raise
+            except OSError as e:
+                if "Too many open files" in str(e):
+                    print("[*]  Too many files open, waiting 2 seconds...")
+                    time.sleep(2)  # 파일들이 닫힐 때까지 대기
+                    continue
+                raise
+            except Exception as e:
+                print(f"[*] Error processing post {post.log_no}: {e}")
                 continue
 
-            # 파일이 없으면 크롤링 진행
-            post_assets_directory = assets_directory / filename
-            post_assets_directory.mkdir(exist_ok=True)
-
-            render_context = with_fetched_local_images(
-                num_workers=8,
-                assets_directory=post_assets_directory,
-                image_src_prefix=f"assets/{filename}/",
-            )
 
-            markdown = as_markdown(**render_context)
-            markdown_file.write_text(markdown, encoding='utf-8')
-            print(f"[*] Saved: {filename}.md")
+def _save_markdown(markdown_file: Path, markdown: bytes):
+    data = memoryview(markdown)
 
-            time.sleep(0.2)
+    try:
+        # 작은 파일이므로 파이썬 버퍼 없이 한 번에 기록 (fsync 생략)
+        fd = os.open(markdown_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
-        except ValueError as e:
-            if "Unknown component type" in str(e):
-                print(f"[*]  Skipped post due to unsupported component: {e}")
-                continue
-            raise
-        except OSError as e:
-            if "Too many open files" in str(e):
-                print("[*]  Too many files open, waiting 2 seconds...")
-                time.sleep(2)  # 파일들이 닫힐 때까지 대기
-                continue
-            raise
-        except Exception as e:
-            print(f"[*] Error processing post {post.log_no}: {e}")
-            continue
+        print(f"[*] Saved: {markdown_file.name}")
+    except Exception as e:
+        # 작성 스레드의 예외는 future에 묻혀 사라지므로 여기서 출력
+        print(f"[*] Error saving {markdown_file.name}: {e}")
 
 
 def to_filename(metadata: dict[Any, Any]) -> str:
@@ -69,7 +119,7 @@ def to_filename(metadata: dict[Any, Any]) -> str:
     """
     # 날짜 추출
     pub_date = metadata.get("pubDate")
-    if isinstance(pub_date, datetime):
+    if isinstance(pub_date, date):
         date_str = pub_date.strftime("%Y-%m-%d")
     else:
         date_str = datetime.now().strftime("%Y-%m-%d")
@@ -77,9 +127,9 @@ def to_filename(metadata: dict[Any, Any]) -> str:
     # 제목 추출 및 정제
     title = metadata.get("title", "untitled")
     sanitized = title.lower()
-    sanitized = re.sub(r'[^\w\s가-힣-]', ' ', sanitized)
-    sanitized = re.sub(r'\s+', '-', sanitized.strip())
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _SANITIZE_NONWORD.sub(' ', sanitized)
+    sanitized = _SANITIZE_SPACES.sub('-', sanitized.strip())
+    sanitized = _SANITIZE_DASHES.sub('-', sanitized)
 
     # 파일명 길이 제한
     max_length = 100
@@ -92,7 +142,6 @@ def to_filename(metadata: dict[Any, Any]) -> str:
 
 if __name__ == "__main__":
     from dotenv import load_dotenv
-    import os
 
     load_dotenv()
 
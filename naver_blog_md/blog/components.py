@@ -1,4 +1,4 @@
-from bs4 import Tag
+from selectolax.lexbor import LexborNode
 
 from naver_blog_md.markdown.models import (
     Block,
@@ -18,43 +18,42 @@ from naver_blog_md.markdown.models import (
 )
 
 
-def section_title_component(component: Tag) -> Block:
+def section_title_component(component: LexborNode) -> Block:
     return SectionTitleBlock(_text_from_tag(component))
 
 
-def text_component(component: Tag) -> list[Block]:
+def text_component(component: LexborNode) -> list[Block]:
     return [
         ParagraphBlock(text=_text_from_tag(tag))
-        for tag in component.select(".se-text-paragraph")
+        for tag in component.css(".se-text-paragraph")
     ]
 
 
-def code_component(component: Tag) -> Block:
+def code_component(component: LexborNode) -> Block:
     """코드 블록 컴포넌트 처리"""
-    code_view = component.select_one(".__se_code_view")
+    code_view = component.css_first(".__se_code_view")
 
     if not code_view:
         return CodeBlock(code="", language="")
 
     # 언어 정보 추출 (class에서 language-xxx 형태로 되어 있음)
     language = ""
-    if code_view.get("class"):
-        for cls in code_view.get("class", []):
-            if cls.startswith("language-"):
-                language = cls.replace("language-", "")
-                break
+    for cls in _classes(code_view):
+        if cls.startswith("language-"):
+            language = cls.replace("language-", "")
+            break
 
     # 코드 내용 추출 - 토큰별로 텍스트를 추출하여 재구성
-    code_text = code_view.get_text()
+    code_text = code_view.text()
 
     return CodeBlock(code=code_text, language=language)
 
 
-def file_component(component: Tag) -> Block:
+def file_component(component: LexborNode) -> Block:
     """첨부파일 컴포넌트 처리"""
     # 파일명 추출
-    filename_elem = component.select_one(".se-file-name")
-    extension_elem = component.select_one(".se-file-extension")
+    filename_elem = component.css_first(".se-file-name")
+    extension_elem = component.css_first(".se-file-extension")
 
     filename = ""
     if filename_elem:
@@ -68,10 +67,10 @@ def file_component(component: Tag) -> Block:
     full_filename = f"{filename}{extension}" if filename and extension else (filename or "unknown")
 
     # 다운로드 링크 추출
-    download_link = component.select_one("a.se-file-save-button")
+    download_link = component.css_first("a.se-file-save-button")
     file_url = ""
-    if download_link and download_link.get("href"):
-        file_url = str(download_link["href"])
+    if download_link:
+        file_url = _attribute(download_link, "href")
 
     return FileBlock(
         filename=full_filename,
@@ -80,12 +79,12 @@ def file_component(component: Tag) -> Block:
     )
 
 
-def horizontal_line_component(component: Tag) -> Block:
+def horizontal_line_component(component: LexborNode) -> Block:
     """수평선 컴포넌트 처리"""
     return HorizontalLineBlock()
 
 
-def material_component(component: Tag) -> Block:
+def material_component(component: LexborNode) -> Block:
     """Material 컴포넌트 처리 - 보통 광고나 외부 링크 등"""
     # Material 컴포넌트는 주로 광고나 외부 컨텐츠이므로
     # 텍스트를 추출하거나 무시할 수 있음
@@ -93,15 +92,15 @@ def material_component(component: Tag) -> Block:
     return MaterialBlock(content=content)
 
 
-def table_component(component: Tag) -> Block:
+def table_component(component: LexborNode) -> Block:
     """테이블 컴포넌트 처리"""
-    table = component.select_one("table.se-table-content")
+    table = component.css_first("table.se-table-content")
 
     if not table:
         return TableBlock(headers=[], rows=[])
 
     # 모든 행 가져오기
-    all_rows = table.select("tr.se-tr")
+    all_rows = table.css("tr.se-tr")
 
     if not all_rows:
         return TableBlock(headers=[], rows=[])
@@ -109,11 +108,11 @@ def table_component(component: Tag) -> Block:
     # 첫 번째 행을 헤더로 간주
     headers = []
     first_row = all_rows[0]
-    header_cells = first_row.select("td.se-cell")
+    header_cells = first_row.css("td.se-cell")
 
     for cell in header_cells:
         # 셀 내부의 텍스트 추출
-        text_elem = cell.select_one(".se-module-text")
+        text_elem = cell.css_first(".se-module-text")
         if text_elem:
             headers.append(_text_from_tag(text_elem))
         else:
@@ -122,11 +121,11 @@ def table_component(component: Tag) -> Block:
     # 나머지 행을 데이터로 처리
     rows = []
     for row in all_rows[1:]:
-        cells = row.select("td.se-cell")
+        cells = row.css("td.se-cell")
         row_data = []
 
         for cell in cells:
-            text_elem = cell.select_one(".se-module-text")
+            text_elem = cell.css_first(".se-module-text")
             if text_elem:
                 row_data.append(_text_from_tag(text_elem))
             else:
@@ -138,14 +137,14 @@ def table_component(component: Tag) -> Block:
     return TableBlock(headers=headers, rows=rows)
 
 
-def image_group_component(component: Tag) -> Block:
-    images = component.select("img")
-    caption = component.select_one(".se-caption")
+def image_group_component(component: LexborNode) -> Block:
+    images = component.css("img")
+    caption = component.css_first(".se-caption")
 
     return ImageGroupBlock(
         images=[
             ImageBlock(
-                src=str(img["src"]),
+                src=_attribute(img, "src"),
                 alt=_text_from_tag(caption) if caption is not None else "",
             )
             for img in images
@@ -153,24 +152,24 @@ def image_group_component(component: Tag) -> Block:
     )
 
 
-def image_strip_component(component: Tag) -> Block:
+def image_strip_component(component: LexborNode) -> Block:
     """이미지 스트립 컴포넌트 처리 - 나란히 배치된 여러 이미지"""
     # 각 이미지 모듈의 캡션 찾기 (있다면)
-    image_modules = component.select(".se-module-image")
+    image_modules = component.css(".se-module-image")
 
     image_blocks = []
     for img_module in image_modules:
-        img = img_module.select_one("img")
+        img = img_module.css_first("img")
         if not img:
             continue
 
         # 각 이미지의 캡션 찾기
-        caption = img_module.select_one(".se-caption")
+        caption = img_module.css_first(".se-caption")
         alt_text = _text_from_tag(caption) if caption else ""
 
         image_blocks.append(
             ImageBlock(
-                src=str(img["src"]),
+                src=_attribute(img, "src"),
                 alt=alt_text,
             )
         )
@@ -178,10 +177,10 @@ def image_strip_component(component: Tag) -> Block:
     return ImageGroupBlock(images=image_blocks)
 
 
-def quotation_component(component: Tag) -> Block:
+def quotation_component(component: LexborNode) -> Block:
     """인용구 컴포넌트 처리"""
-    quote_elem = component.select_one(".se-quote")
-    cite_elem = component.select_one(".se-cite")
+    quote_elem = component.css_first(".se-quote")
+    cite_elem = component.css_first(".se-cite")
 
     quote_text = _text_from_tag(quote_elem) if quote_elem else ""
     cite_text = _text_from_tag(cite_elem) if cite_elem else ""
@@ -189,19 +188,19 @@ def quotation_component(component: Tag) -> Block:
     return QuotationBlock(text=quote_text, cite=cite_text)
 
 
-def image_component(component: Tag) -> Block:
-    img = component.select_one("img")
-    video = component.select_one("video")
+def image_component(component: LexborNode) -> Block:
+    img = component.css_first("img")
+    video = component.css_first("video")
 
     match img, video:
-        case Tag(), None:
-            src = str(img["src"])
-        case None, Tag():
-            src = str(video["src"])
+        case LexborNode(), None:
+            src = _attribute(img, "src")
+        case None, LexborNode():
+            src = _attribute(video, "src")
         case _:
             assert False, "Image and video are mutually exclusive"
 
-    caption = component.select_one(".se-caption")
+    caption = component.css_first(".se-caption")
 
     return ImageBlock(
         src=src,
@@ -209,14 +208,22 @@ def image_component(component: Tag) -> Block:
     )
 
 
-def _text_from_tag(tag: Tag):
-    return tag.get_text(strip=True).strip()
+def _text_from_tag(tag: LexborNode):
+    return tag.text(strip=True).strip()
 
 
-def wrapping_paragraph_component(component: Tag) -> Block:
+def _attribute(tag: LexborNode, name: str) -> str:
+    return tag.attributes.get(name) or ""
+
+
+def _classes(tag: LexborNode) -> list[str]:
+    return _attribute(tag, "class").split()
+
+
+def wrapping_paragraph_component(component: LexborNode) -> Block:
     """텍스트 박스나 래핑된 단락 컴포넌트 처리"""
     # se-wrappingParagraph는 보통 텍스트 박스나 특별한 스타일의 단락
-    text_elem = component.select_one(".se-module-text")
+    text_elem = component.css_first(".se-module-text")
 
     if text_elem:
         text = _text_from_tag(text_elem)
@@ -226,75 +233,75 @@ def wrapping_paragraph_component(component: Tag) -> Block:
     return ParagraphBlock(text=text)
 
 
-def formula_component(component: Tag) -> Block:
+def formula_component(component: LexborNode) -> Block:
     """수식 컴포넌트 처리 (LaTeX)"""
     # 수식 데이터 추출
-    formula_elem = component.select_one(".se-module-formula")
+    formula_elem = component.css_first(".se-module-formula")
 
     if not formula_elem:
         return FormulaBlock(formula="", display_mode=True)
 
     # data-katex 속성에서 LaTeX 수식 추출
-    formula = formula_elem.get("data-katex", "")
+    formula = _attribute(formula_elem, "data-katex")
 
     # 또는 data-latex 속성 확인
     if not formula:
-        formula = formula_elem.get("data-latex", "")
+        formula = _attribute(formula_elem, "data-latex")
 
     # 또는 텍스트 내용 추출
     if not formula:
         formula = _text_from_tag(formula_elem)
 
     # display 모드 확인 (블록 수식 vs 인라인 수식)
-    display_mode = "display" in formula_elem.get("class", [])
+    display_mode = "display" in _classes(formula_elem)
 
     return FormulaBlock(formula=formula, display_mode=display_mode)
 
 
-def video_component(component: Tag) -> Block:
+def video_component(component: LexborNode) -> Block:
     """비디오 컴포넌트 처리"""
-    video_elem = component.select_one("video")
-    iframe_elem = component.select_one("iframe")
+    video_elem = component.css_first("video")
+    iframe_elem = component.css_first("iframe")
 
     src = ""
     thumbnail = ""
 
     if video_elem:
         # 네이버 블로그 자체 비디오
-        src = video_elem.get("src", "")
-        poster = video_elem.get("poster", "")
+        src = _attribute(video_elem, "src")
+        poster = _attribute(video_elem, "poster")
         thumbnail = poster if poster else ""
     elif iframe_elem:
         # 임베디드 비디오 (YouTube 등)
-        src = iframe_elem.get("src", "")
+        src = _attribute(iframe_elem, "src")
     else:
         # data 속성에서 추출 시도
-        video_data = component.get("data-module", {})
+        video_data = component.attributes.get("data-module", {})
         if isinstance(video_data, dict):
             src = video_data.get("src", "")
 
     # 캡션 추출
-    caption = component.select_one(".se-caption")
+    caption = component.css_first(".se-caption")
     alt_text = _text_from_tag(caption) if caption else ""
 
     return VideoBlock(src=src, alt=alt_text, thumbnail=thumbnail)
 
 
-def anniversary_section_component(component: Tag) -> Block:
+def anniversary_section_component(component: LexborNode) -> Block:
     """기념일 섹션 컴포넌트 처리"""
     # 기념일 섹션은 네이버 블로그의 특수 컴포넌트
     # 텍스트 내용을 추출하거나 무시할 수 있음
 
     # 제목 추출
-    title_elem = component.select_one(".se-anniversary-title")
+    title_elem = component.css_first(".se-anniversary-title")
     title = _text_from_tag(title_elem) if title_elem else ""
 
     # 날짜 추출
-    date_elem = component.select_one(".se-anniversary-date")
+    date_elem = component.css_first(".se-anniversary-date")
     date = _text_from_tag(date_elem) if date_elem else ""
 
     # 설명 추출
-    desc_elem = component.select_one(".se-anniversary-desc")
+    desc_elem = component.css_first(".se-anniversary-desc")
     desc = _text_from_tag(desc_elem) if desc_elem else ""
 
     # 전체 내용 조합
@@ -1,31 +1,85 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
-from typing import Iterator, Unpack
+from typing import Callable, Iterable, Iterator, Unpack
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from naver_blog_md.blog import components as Components
 from naver_blog_md.blog import metadata as Metadata
 from naver_blog_md.blog.models import PostItem, PostListResponse
 from naver_blog_md.fp.lazy_val import lazy_val
+from naver_blog_md.http.session import SESSION
 from naver_blog_md.markdown.context import MarkdownRenderContext
 from naver_blog_md.markdown.models import Block, ImageBlock, ImageGroupBlock, MaterialBlock
 from naver_blog_md.markdown.render import blocks_as_markdown
-from naver_blog_md.multiprocess.pool import use_map
+
+# str.translate는 한글이 섞인 문자열에서 문자마다 dict를 조회하므로 정규식보다 느림
+_UNICODE_STRIP = re.compile(
+    r"[\u0000-\u0008\u000b-\u000c\u000e-\u001f\u007f-\u009f\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200b-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]+"
+)
+
+
+def _single_block(
+    component: Callable[[LexborNode], Block],
+) -> Callable[[LexborNode], Iterable[Block]]:
+    return lambda node: (component(node),)
+
+
+def _skipped_component(component: LexborNode) -> Iterable[Block]:
+    return ()
+
+
+def _oembed_component(component: LexborNode) -> Iterable[Block]:
+    # oembed (YouTube, Twitter 등)를 링크로 변환
+    oembed_data = component.attributes.get('data', {})
+    url = oembed_data.get('url') or oembed_data.get('originalUrl')
+
+    if url:
+        # 링크를 마크다운 텍스트로 변환
+        title = oembed_data.get('title', 'Embedded Content')
+        # TextBlock 형태로 변환하여 yield
+        text_component = {
+            'componentType': 'text',
+            'data': {
+                'text': f'[{title}]({url})\n'
+            }
+        }
+        yield MaterialBlock(text_component)
+
+
+_COMPONENT_HANDLERS: dict[str, Callable[[LexborNode], Iterable[Block]]] = {
+    "se-sectionTitle": _single_block(Components.section_title_component),
+    "se-image": _single_block(Components.image_component),
+    "se-imageGroup": _single_block(Components.image_group_component),
+    "se-imageStrip": _single_block(Components.image_strip_component),
+    "se-placesMap": _skipped_component,
+    "se-quotation": _single_block(Components.quotation_component),
+    "se-code": _single_block(Components.code_component),
+    "se-file": _single_block(Components.file_component),
+    "se-horizontalLine": _single_block(Components.horizontal_line_component),
+    "se-table": _single_block(Components.table_component),
+    "se-text": Components.text_component,
+    "se-material": _single_block(Components.material_component),
+    "se-sticker": _skipped_component,
+    "se-oglink": _skipped_component,
+    "se-oembed": _oembed_component,
+    "se-wrappingParagraph": _single_block(Components.wrapping_paragraph_component),
+    "se-formula": _single_block(Components.formula_component),
+    "se-video": _single_block(Components.video_component),
+    "se-anniversarySection": _single_block(Components.anniversary_section_component),
+}
 
 
 def use_post(blog_id: str, log_no: int):
 
     @lazy_val
-    def root() -> Tag:
-        response = requests.get(
+    def root() -> LexborHTMLParser:
+        response = SESSION.get(
             "https://blog.naver.com/PostView.naver",
             params={"blogId": blog_id, "logNo": log_no},
         )
-        return BeautifulSoup(
-            _remove_unicode_special_characters(response.text), "html.parser"
-        )
+        return LexborHTMLParser(_remove_unicode_special_characters(response.text))
 
     @lazy_val
     def preview_image():
@@ -36,63 +90,9 @@ def use_post(blog_id: str, log_no: int):
             root(), Metadata.tags(blog_id, log_no), preview_image()
         )
 
-    def as_blocks() -> Iterator[Block]:
-        for component in root().select(".se-main-container .se-component"):
-            match component["class"][1]:
-                case "se-sectionTitle":
-                    yield Components.section_title_component(component)
-                case "se-image":
-                    yield Components.image_component(component)
-                case "se-imageGroup":
-                    yield Components.image_group_component(component)
-                case "se-imageStrip":  # 이미지 스트립 처리 추가
-                    yield Components.image_strip_component(component)
-                case "se-placesMap":
-                    pass
-                case "se-quotation":  # 인용구 처리 추가
-                    yield Components.quotation_component(component)
-                case "se-code":  # 코드 블록 처리 추가
-                    yield Components.code_component(component)
-                case "se-file":
-                    yield Components.file_component(component)
-                case "se-horizontalLine":  # 수평선 처리 추가
-                    yield Components.horizontal_line_component(component)
-                case "se-table":  # 테이블 처리 추가
-                    yield Components.table_component(component)
-                case "se-text":
-                    yield from Components.text_component(component)
-                case "se-material":  # Material 처리 추가
-                    yield Components.material_component(component)
-                case 'se-sticker':
-                    pass
-                case "se-oglink":
-                    pass
-                case 'se-oembed':
-                    # oembed (YouTube, Twitter 등)를 링크로 변환
-                    oembed_data = component.get('data', {})
-                    url = oembed_data.get('url') or oembed_data.get('originalUrl')
-
-                    if url:
-                        # 링크를 마크다운 텍스트로 변환
-                        title = oembed_data.get('title', 'Embedded Content')
-                        # TextBlock 형태로 변환하여 yield
-                        text_component = {
-                            'componentType': 'text',
-                            'data': {
-                                'text': f'[{title}]({url})\n'
-                            }
-                        }
-                        yield MaterialBlock(text_component)
-                case "se-wrappingParagraph":
-                    yield Components.wrapping_paragraph_component(component)
-                case "se-formula":
-                    yield Components.formula_component(component)
-                case "se-video":
-                    yield Components.video_component(component)
-                case "se-anniversarySection":
-                    yield Components.anniversary_section_component(component)
-                case unknown:
-                    raise ValueError(f"Unknown component type: {unknown}")
+    @lazy_val
+    def as_blocks() -> list[Block]:
+        return list(_blocks_of_root(root()))
 
     def as_markdown(**context: Unpack[MarkdownRenderContext]):
         return blocks_as_markdown(as_blocks(), metadata(), **context)
@@ -104,19 +104,28 @@ def use_post(blog_id: str, log_no: int):
     )
 
 
-def _first_image_of_blocks(blocks: Iterator[Block]) -> ImageBlock | None:
-    try:
-        block = next(blocks)
-    except StopIteration:
-        return None
+def _blocks_of_root(root: LexborHTMLParser) -> Iterator[Block]:
+    for component in root.css(".se-main-container .se-component"):
+        component_type = component.attributes["class"].split()[1]
+        handler = _COMPONENT_HANDLERS.get(component_type)
+
+        if handler is None:
+            raise ValueError(f"Unknown component type: {component_type}")
 
-    match block:
-        case ImageBlock(src, alt):
-            return ImageBlock(src, alt)
-        case ImageGroupBlock(images):
-            return ImageBlock(images[0].src, images[0].alt)
-        case _:
-            return _first_image_of_blocks(blocks)
+        yield from handler(component)
+
+
+def _first_image_of_blocks(blocks: Iterable[Block]) -> ImageBlock | None:
+    for block in blocks:
+        match block:
+            case ImageBlock(src, alt):
+                return ImageBlock(src, alt)
+            case ImageGroupBlock([first, *_]):
+                return ImageBlock(first.src, first.alt)
+            case _:
+                pass
+
+    return None
 
 
 def use_blog(blog_id: str):
@@ -143,13 +152,16 @@ def use_blog(blog_id: str):
         if total_pages == 1:
             return first_response.post_list
 
-        map = use_map(8)
-
         # 2페이지부터 마지막 페이지까지
-        remaining_pages = map(
-            lambda page_number: _fetch_page_safe(blog_id, page_number, count_per_page),
-            range(2, total_pages + 1),
-        )
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            remaining_pages = list(
+                executor.map(
+                    lambda page_number: _fetch_page_safe(
+                        blog_id, page_number, count_per_page
+                    ),
+                    range(2, total_pages + 1),
+                )
+            )
 
         # 결과 합치기
         all_posts = first_response.post_list + [
@@ -178,7 +190,7 @@ def _fetch_page_safe(blog_id: str, page_number: int, count_per_page: int) -> lis
 def _post_title_list(
     blog_id: str, current_page: int = 1, category_no: int = 0, count_per_page: int = 30
 ):
-    response = requests.get(
+    response = SESSION.get(
         "https://blog.naver.com/PostTitleListAsync.naver",
         params={
             "blogId": blog_id,
@@ -188,17 +200,17 @@ def _post_title_list(
         },
     )
 
-    response_text = response.text
+    content = response.content
 
-    # pagingHtml 제거
-    if ',"pagingHtml"' in response_text:
-        response_text = response_text.split(',"pagingHtml"')[0] + "}"
+    # pagingHtml 제거 (디코딩/분할 없이 바이트 그대로 잘라냄)
+    paging_html_index = content.find(b',"pagingHtml"')
+    if paging_html_index != -1:
+        content = content[:paging_html_index] + b"}"
 
-    return PostListResponse.model_validate_json(response_text)
+    return PostListResponse.model_validate_json(content)
 
 
 def _remove_unicode_special_characters(text: str):
-    pattern = r"[\u0000-\u0008\u000b-\u000c\u000e-\u001f\u007f-\u009f\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200b-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]"
-    cleaned_text = re.sub(pattern, "", text)
+    cleaned_text = _UNICODE_STRIP.sub("", text)
 
     return cleaned_text
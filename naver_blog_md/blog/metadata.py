@@ -1,14 +1,14 @@
 from datetime import datetime
 from urllib.parse import unquote
 
-import requests
-from bs4 import Tag
+from selectolax.lexbor import LexborHTMLParser
 
+from naver_blog_md.http.session import SESSION
 from naver_blog_md.markdown.models import ImageBlock
 
 
 def metadata(
-    root: Tag,
+    root: LexborHTMLParser,
     tags: list[str],
     preview_image: ImageBlock | None,
 ):
@@ -33,44 +33,44 @@ def metadata(
     }
 
 
-def title(root: Tag) -> str:
-    tag = root.select_one(".se-title-text")
+def title(root: LexborHTMLParser) -> str:
+    tag = root.css_first(".se-title-text")
 
     assert tag is not None, "No title found"
 
-    return tag.text.strip()
+    return tag.text().strip()
 
 
-def nickname(root: Tag):
-    tag = root.select_one(".nick")
+def nickname(root: LexborHTMLParser):
+    tag = root.css_first(".nick")
 
     assert tag is not None, "No nickname found"
 
-    return tag.text.strip()
+    return tag.text().strip()
 
 
-def pub_date(root: Tag):
-    tag = root.select_one(".se_publishDate")
+def pub_date(root: LexborHTMLParser):
+    tag = root.css_first(".se_publishDate")
 
     assert tag is not None, "No pub date found"
 
     return datetime.strptime(
-        tag.text.strip() + "+0900", "%Y. %m. %d. %H:%M%z"
+        tag.text().strip() + "+0900", "%Y. %m. %d. %H:%M%z"
     )  # FIXME: Timezone is hardcoded
 
 
-def category(root: Tag) -> str:
-    tag = root.select_one(".blog2_series")
+def category(root: LexborHTMLParser) -> str:
+    tag = root.css_first(".blog2_series")
 
     assert tag is not None, "No category found"
 
-    return tag.text.strip()
+    return tag.text().strip()
 
 
 def tags(blog_id: str, log_no: int):
     url = f"https://blog.naver.com/BlogTagListInfo.naver?blogId={blog_id}&logNoList={log_no}&logType=mylog"
 
-    response = requests.get(url)
+    response = SESSION.get(url)
 
     return [
         tag
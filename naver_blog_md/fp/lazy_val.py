@@ -13,12 +13,14 @@ def lazy_val(func: Callable[[], T]) -> Callable[[], T]:
     Returns:
         Callable[[], T]: A function that lazily evaluates the decorated function.
     """
-    value = None
+    evaluated = False
+    value: T
 
     def wrapper() -> T:
-        nonlocal value
-        if value is None:
+        nonlocal evaluated, value
+        if not evaluated:
             value = func()
+            evaluated = True
         return value
 
     return wrapper
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any, Callable
+
+import requests
+
+
+def use_throttle(
+    min_interval: float = 0.2,
+    initial_delay: float = 0.2,
+    max_delay: float = 30.0,
+    recovery_streak: int = 10,
+) -> tuple[Callable[[], None], Callable[..., None]]:
+    """
+    Adaptive delay driven by the responses the server actually sends.
+
+    `wait` never returns sooner than `min_interval` after the previous call, which
+    caps the base rate (5 per second by default). On top of that, a backoff delay
+    stays at zero while requests succeed. It is doubled (starting from
+    `initial_delay`, capped at `max_delay`) on HTTP 429 or 5xx, honoring
+    `Retry-After` when present, and halved again after `recovery_streak`
+    consecutive successful responses.
+
+    Returns:
+        tuple: `wait` to call before each request batch, and `observe` to register
+        as a `requests` response hook.
+    """
+    lock = threading.Lock()
+    delay = 0.0
+    streak = 0
+    next_at = 0.0
+
+    def wait():
+        nonlocal next_at
+
+        with lock:
+            now = time.monotonic()
+            start = max(next_at, now) + delay
+            next_at = start + min_interval
+
+        if start > now:
+            time.sleep(start - now)
+
+    def observe(response: requests.Response, *args: Any, **kwargs: Any):
+        nonlocal delay, streak
+
+        with lock:
+            if response.status_code == 429 or response.status_code >= 500:
+                delay = min(
+                    max(delay * 2, initial_delay, _retry_after(response)), max_delay
+                )
+                streak = 0
+                return
+
+            streak += 1
+            if delay > 0 and streak >= recovery_streak:
+                delay = delay / 2 if delay / 2 >= initial_delay else 0.0
+                streak = 0
+
+    return (wait, observe)
+
+
+def _retry_after(response: requests.Response) -> float:
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
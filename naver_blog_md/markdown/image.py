@@ -1,9 +1,21 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Literal, TypedDict, Unpack
+from typing import Callable, Iterable, Literal, TypedDict, Unpack
 from urllib.parse import unquote_plus
 
 import requests
 
+from naver_blog_md.http.session import SESSION
+
+_IMAGE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://blog.naver.com/",
+    "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+}
+
 
 class ImageDefaultContext(TypedDict):
     image_processor_variant: Literal["default"]
@@ -29,13 +41,25 @@ def use_image_processor(context: ImageContext) -> Callable[[str], str]:
         case "cdn":
             return _original_image_url
         case "fetch":
-            return lambda src: _fetch_image_processor(src, **context)
+            return lambda src: _batch_fetch([src], 1, **context)[src]
+
+
+def use_batch_image_processor(
+    context: ImageContext, num_workers: int
+) -> Callable[[Iterable[str]], dict[str, str]]:
+    match context["image_processor_variant"]:
+        case "default" | "cdn":
+            image_processor = use_image_processor(context)
+            return lambda srcs: {src: image_processor(src) for src in srcs}
+        case "fetch":
+            return lambda srcs: _batch_fetch(list(srcs), num_workers, **context)
 
 
 def _identity(src: str) -> str:
     return src
 
 
+@lru_cache(maxsize=4096)
 def _original_image_url(src: str) -> str:
     return (
         src.split("?")[0]
@@ -46,33 +70,90 @@ def _original_image_url(src: str) -> str:
     )
 
 
-def _fetch_image_processor(src: str, **context: Unpack[ImageFetchContext]) -> str:
-    assert context["assets_directory"].is_dir()
+def _batch_fetch(
+    srcs: list[str], num_workers: int, **context: Unpack[ImageFetchContext]
+) -> dict[str, str]:
+    # 썸네일/원본 크기 등 원본 URL이 같은 이미지는 한 번만 내려받음
+    urls = list(dict.fromkeys(map(_original_image_url, srcs)))
+    filenames = _unique_filenames(urls)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        fetched_by_url = dict(
+            zip(
+                urls,
+                executor.map(
+                    lambda url, filename: _fetch_original_image(
+                        url, filename, **context
+                    ),
+                    urls,
+                    filenames,
+                ),
+            )
+        )
 
-    url = _original_image_url(src)
+    return {src: fetched_by_url[_original_image_url(src)] or src for src in srcs}
 
-    try:
-        # User-Agent 및 Referer 헤더 추가
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Referer': 'https://blog.naver.com/',
-            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-        }
 
-        response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-        response.raise_for_status()
+def _unique_filenames(urls: list[str]) -> list[str]:
+    # 붙여넣은 스크린샷(image.png 등)은 URL이 달라도 파일명이 같으므로 번호를 붙여 구분
+    taken: set[str] = set()
+    filenames = []
 
+    for url in urls:
         filename = unquote_plus(url.split("/")[-1])
+        stem, suffix = os.path.splitext(filename)
+        index = 1
+        while filename in taken:
+            index += 1
+            filename = f"{stem}-{index}{suffix}"
+
+        taken.add(filename)
+        filenames.append(filename)
+
+    return filenames
+
 
-        (context["assets_directory"] / filename).write_bytes(response.content)
+def _fetch_original_image(
+    url: str, filename: str, **context: Unpack[ImageFetchContext]
+) -> str | None:
+    assert context["assets_directory"].is_dir()
+
+    try:
+        with SESSION.get(
+            url,
+            headers=_IMAGE_REQUEST_HEADERS,
+            timeout=15,
+            allow_redirects=True,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            destination = context["assets_directory"] / filename
+
+            # 응답 본문을 메모리에 올리지 않고 다운로드마다 따로 만든 임시 파일에 받은 뒤,
+            # 끝까지 받은 경우에만 최종 파일명으로 교체
+            fd, partial = tempfile.mkstemp(
+                dir=context["assets_directory"], suffix=".part"
+            )
+            try:
+                with open(fd, "wb", buffering=1 << 20) as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        file.write(chunk)
+                # mkstemp는 0600으로 만들므로 일반 파일 권한으로 맞춤
+                os.chmod(partial, 0o644)
+                os.replace(partial, destination)
+            except BaseException:
+                Path(partial).unlink(missing_ok=True)
+                raise
 
         return f"{context['image_src_prefix']}{filename}"
 
     except requests.exceptions.RequestException as e:
         # 다운로드 실패 시 원본 URL 반환
         print(f"Warning: Failed to fetch image {url}: {e}. Using original URL.")
-        return src
+        return None
     except Exception as e:
         # 파일 쓰기 실패 등 기타 에러
         print(f"Warning: Error processing image {url}: {e}. Using original URL.")
-        return src
+        return None
+
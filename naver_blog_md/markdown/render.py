@@ -1,9 +1,11 @@
-from typing import Any, Iterator, Unpack
-
-import yaml
+import json
+import re
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Callable, Iterator, Unpack
 
 from naver_blog_md.markdown.context import MarkdownRenderContext, with_default
-from naver_blog_md.markdown.image import use_image_processor
+from naver_blog_md.markdown.image import ImageContext, use_batch_image_processor
 from naver_blog_md.markdown.models import (
     Block,
     CodeBlock,
@@ -20,35 +22,61 @@ from naver_blog_md.markdown.models import (
     VideoBlock,
     AnniversarySectionBlock
 )
-from naver_blog_md.multiprocess.pool import use_map
+
+# JSON은 이스케이프하지 않지만 YAML에서는 출력할 수 없는 문자들
+_YAML_NON_PRINTABLE = re.compile("[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff]")
 
 
 def blocks_as_markdown(
-    blocks: Iterator[Block],
+    blocks: list[Block],
     front_matter: dict[Any, Any] | None = None,
     result: str = "",
     **context: Unpack[MarkdownRenderContext],
 ) -> str:
 
-    if front_matter is not None and result == "":
-        result = _front_matter_as_yaml(front_matter, **context)
+    if result != "":
+        front_matter = None
 
-    map = use_map(context["num_workers"])
+    # front matter 이미지와 본문 이미지를 한 번에 처리 (처리기는 포스트당 한 번만 생성)
+    batch_image_processor = use_batch_image_processor(
+        _image_context_with_fallback(**context), context["num_workers"]
+    )
+    processed_image_src = batch_image_processor(
+        chain(_image_srcs_of_front_matter(front_matter), _image_srcs_of_blocks(blocks))
+    ).__getitem__
 
-    rendered_blocks = map(
-        lambda block: _block_as_markdown(block, **context),
-        blocks,
+    if front_matter is not None:
+        result = _front_matter_as_yaml(front_matter, processed_image_src)
+
+    rendered_blocks = (
+        _block_as_markdown(block, processed_image_src) for block in blocks
     )
 
     return (result + "".join(rendered_blocks)).strip() + "\n"
 
 
+def _image_srcs_of_front_matter(front_matter: dict[Any, Any] | None) -> Iterator[str]:
+    if front_matter is not None and "url" in front_matter.get("image", {}):
+        yield front_matter["image"]["url"]
+
+
+def _image_srcs_of_blocks(blocks: list[Block]) -> Iterator[str]:
+    for block in blocks:
+        match block:
+            case ImageBlock(src) if src != "":
+                yield src
+            case ImageGroupBlock(images):
+                yield from (image.src for image in images)
+            case VideoBlock(src, thumbnail=thumbnail) if src != "" and thumbnail:
+                yield thumbnail
+            case _:
+                pass
+
+
 def _block_as_markdown(
     block: Block,
-    **context: Unpack[MarkdownRenderContext],
+    processed_image_src: Callable[[str], str],
 ) -> str:
-    processed_image_src = _use_image_processor_with_fallback(**context)
-
     match block:
         case SectionTitleBlock(text):
             return f"## {text.strip()}\n\n"
@@ -160,28 +188,71 @@ def _block_as_markdown(
 
 def _front_matter_as_yaml(
     front_matter: dict[Any, Any],
-    **context: Unpack[MarkdownRenderContext],
+    processed_image_src: Callable[[str], str],
 ) -> str:
     if "image" in front_matter and "url" in front_matter["image"]:
-        image_processor = _use_image_processor_with_fallback(**context)
-        front_matter["image"]["url"] = image_processor(front_matter["image"]["url"])
+        front_matter["image"]["url"] = processed_image_src(front_matter["image"]["url"])
 
     return (
-        "---\n" + yaml.safe_dump(
-            front_matter,
-            default_flow_style=False,
-            allow_unicode=True,
-            default_style=None,
-        ) + "---\n\n"
+        "---\n"
+        + "".join(
+            f"{line}\n"
+            for key in sorted(front_matter)
+            for line in _yaml_lines(key, front_matter[key])
+        )
+        + "---\n\n"
     )
 
 
-def _use_image_processor_with_fallback(**context: Unpack[MarkdownRenderContext]):
+def _yaml_lines(key: str, value: Any, indent: str = "") -> Iterator[str]:
+    """front matter 스키마(문자열, 숫자, 날짜, 목록, 중첩 dict)만 다루는 YAML 블록 출력"""
+    match value:
+        case dict() if value:
+            yield f"{indent}{key}:"
+            for child_key in sorted(value):
+                yield from _yaml_lines(child_key, value[child_key], indent + "  ")
+        case list() if value:
+            yield f"{indent}{key}:"
+            yield from (f"{indent}- {_yaml_scalar(item)}" for item in value)
+        case _:
+            yield f"{indent}{key}: {_yaml_scalar(value)}"
+
+
+def _yaml_scalar(value: Any) -> str:
+    match value:
+        case None:
+            return "null"
+        case bool():
+            return "true" if value else "false"
+        case int() | float():
+            return str(value)
+        case datetime():
+            return value.isoformat(" ")
+        case date():
+            return value.isoformat()
+        case dict() if not value:
+            return "{}"
+        case list() if not value:
+            return "[]"
+        case str():
+            # JSON 문자열은 그대로 YAML double-quoted 스칼라로 사용 가능
+            return _YAML_NON_PRINTABLE.sub(
+                lambda match: f"\\u{ord(match[0]):04x}",
+                json.dumps(value, ensure_ascii=False),
+            )
+        case _:
+            # 목록 안의 중첩 컨테이너 등 지원하지 않는 값은 조용히 버리지 않고 실패
+            raise TypeError(
+                f"Unsupported front matter value: {type(value).__name__}"
+            )
+
+
+def _image_context_with_fallback(
+    **context: Unpack[MarkdownRenderContext],
+) -> ImageContext:
     if "image_context" not in context:
         default_context = with_default()
         assert "image_context" in default_context
-        image_context = default_context["image_context"]
-    else:
-        image_context = context["image_context"]
+        return default_context["image_context"]
 
-    return use_image_processor(image_context)
+    return context["image_context"]